@@ -1,8 +1,44 @@
+import time
+
+# Taken before any other import so the timings below cover the whole script
+script_start = time.perf_counter()
+
+import glob
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px  # For interactive plots
+
+# Already loaded by the Streamlit server, so importing it here costs nothing;
+# only plotly.express is deferred to the chart section
 import plotly.graph_objects as go
-import streamlit as st
+
+script_import_seconds = time.perf_counter() - script_start
+
+
+# Seconds since this process was launched, or None where /proc is unavailable.
+# Under `streamlit run` the server (and the Streamlit import) starts before the
+# script does, so this is the only way to see the full cold start.
+def process_age():
+    try:
+        with open("/proc/self/stat") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+process_age_at_script_start = process_age()
 
 # -----------------------------------
 # Streamlit App Code with Adjustments
@@ -11,18 +47,112 @@ import streamlit as st
 # Set the page configuration
 st.set_page_config(page_title="Watch Data Analysis", layout="wide")
 
+
+# Cold-start timings, recorded by the first run in each server process
+@st.cache_resource
+def get_startup_timings():
+    return {}
+
+
+startup_timings = get_startup_timings()
+if process_age_at_script_start is not None:
+    startup_timings.setdefault(
+        "Process start to script start", process_age_at_script_start
+    )
+startup_timings.setdefault("Script imports", script_import_seconds)
+
 # -----------------------------------
 # 1. Load the DataFrame
 # -----------------------------------
 
 
-@st.cache_data
-def load_data():
-    df = pd.read_csv("cleaned_watch_data_with_flags.csv")
-    return df
+# A single CSV, a directory of per-brand CSV shards, or a glob of shards
+data_source = os.environ.get("WATCH_DATA_SOURCE", "cleaned_watch_data_with_flags.csv")
+
+# Raw input columns every shard must have; the standardized and match columns
+# are recomputed below, and any other column is dropped
+required_columns = [
+    "Brand",
+    "ModelNumber",
+    "Price_YourData",
+    "Price_TimeZ",
+    "CaseDiameter_YourData",
+    "CaseDiameter_TimeZ",
+    "CaseMaterial_YourData",
+    "CaseMaterial_TimeZ",
+]
+
+
+def list_shards(source):
+    if os.path.isdir(source):
+        paths = glob.glob(os.path.join(source, "*.csv"))
+    else:
+        paths = glob.glob(source)
+    if not paths:
+        raise FileNotFoundError(f"No CSV files found for data source '{source}'.")
+    return sorted(paths)
+
+
+def read_shard(path):
+    # The pyarrow engine parses each file with multiple threads, column-wise
+    shard = pd.read_csv(path, engine="pyarrow")
+    missing = [col for col in required_columns if col not in shard.columns]
+    if missing:
+        raise ValueError(f"Shard '{path}' is missing required columns: {missing}.")
+    return shard[required_columns]
+
+
+# Parsed shards keyed by path, kept with the (mtime, size) they were read at,
+# and the lock that serializes refreshes of them across sessions
+@st.cache_resource
+def get_shard_cache():
+    return {}, threading.Lock()
+
+
+# Only the current dataset is kept; older assembled frames are evicted
+@st.cache_data(max_entries=1)
+def assemble_shards(shard_signatures):
+    shard_cache, shard_cache_lock = get_shard_cache()
+    with shard_cache_lock:
+        # Forget shards that were deleted or renamed since the last refresh
+        current_paths = {path for path, _ in shard_signatures}
+        for path in list(shard_cache):
+            if path not in current_paths:
+                del shard_cache[path]
+        stale = [
+            (path, signature)
+            for path, signature in shard_signatures
+            if path not in shard_cache or shard_cache[path][0] != signature
+        ]
+        if stale:
+            # Only shards whose files changed are parsed again
+            max_workers = min(len(stale), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                shards = pool.map(read_shard, [path for path, _ in stale])
+                for (path, signature), shard in zip(stale, shards):
+                    shard_cache[path] = (signature, shard)
+        # One concatenation over all shards instead of appending them one by one
+        return pd.concat(
+            [shard_cache[path][1] for path, _ in shard_signatures], ignore_index=True
+        )
+
+
+# Returns the frame together with the shard signatures it was built from, which
+# identify the dataset for the caches further down
+def load_data(source=data_source):
+    shard_signatures = []
+    for path in list_shards(source):
+        stat = os.stat(path)
+        shard_signatures.append((path, (stat.st_mtime_ns, stat.st_size)))
+    shard_signatures = tuple(shard_signatures)
+    return assemble_shards(shard_signatures), shard_signatures
 
 
-df = load_data()
+try:
+    df, shard_signatures = load_data()
+except (FileNotFoundError, ValueError) as error:
+    st.error(str(error))
+    st.stop()
 
 # -----------------------------------
 # 1a. Data Cleaning and Standardization
@@ -38,7 +168,8 @@ df["CaseDiameter_YourData"] = pd.to_numeric(
 
 # **A. Standardize Case Materials**
 
-# Create a detailed mapping dictionary for case materials
+# Create a detailed mapping dictionary for case materials. Combinations such as
+# "steel, rose gold" are assembled by the rules below from these entries.
 case_material_mapping = {
     # Stainless Steel
     "stainless steel": "stainless steel",
@@ -47,7 +178,6 @@ case_material_mapping = {
     "esteel": "stainless steel",
     "polished stainless steel": "stainless steel",
     "polished stainless steel & blue yas": "stainless steel",
-    "microblasted steel & yellow gold": "stainless steel and yellow gold",
     "steel with pvd coating": "stainless steel with PVD coating",
     # Gold
     "gold": "gold",
@@ -61,8 +191,6 @@ case_material_mapping = {
     "18-carat sand gold": "gold",
     "18k pink gold": "rose gold",
     "18-ct rose gold": "rose gold",
-    "18-ct rose gold with gold bezel": "rose gold",
-    "18-ct rose gold with black ceramic bezel": "rose gold",
     "18-ct yellow gold": "gold",
     "18k white gold": "white gold",
     # Rose Gold
@@ -70,92 +198,208 @@ case_material_mapping = {
     "18k rose gold": "rose gold",
     "red gold": "rose gold",
     "pink gold": "rose gold",
-    "pink gold, red gold": "rose gold",
-    "rose gold, pink gold": "rose gold",
-    "18k pink gold": "rose gold",
-    "18-carat pink gold": "rose gold",
-    "rose gold with diamond-set bezel": "rose gold",
-    "rose gold, diamond": "rose gold",
-    "rose gold, diamond, pink sapphire": "rose gold",
-    "steel, rose gold, diamond": "stainless steel and rose gold",
-    "black carbon & 18-ct rose gold": "black carbon and rose gold",
-    "titanium gold": "titanium and gold",
-    "stainless steel & 18-carat rose gold": "stainless steel and rose gold",
     # White Gold
     "white gold": "white gold",
-    "18k white gold": "white gold",
     "platinum 950": "platinum",
-    "white gold, diamond": "white gold",
-    "white gold, diamond, blue sapphire": "white gold",
-    "white gold, sapphire": "white gold",
-    "white gold, rose gold": "white gold and rose gold",
-    "white gold, ceramic": "white gold and ceramic",
-    "white gold, sapphire": "white gold",
     # Titanium
     "titanium": "titanium",
     "ti": "titanium",
+    "titanium gold": "titanium and gold",
     "titanium dlc": "titanium DLC",
     "microblasted titanium": "titanium",
     "brushed titanium": "titanium",
-    "brushed titanium & chalcedony": "titanium and chalcedony",
-    "titanium,carbon": "titanium and carbon",
-    "titanium,ceramic": "titanium and ceramic",
-    "titanium,ceramic,bronze": "titanium, ceramic, and bronze",
-    "titanium,forged carbon": "titanium and forged carbon",
-    "titanium gold": "titanium and gold",
-    "titanium,rose gold": "titanium and rose gold",
-    "titanium,diamond": "titanium and diamond",
     # Ceramic
     "ceramic": "ceramic",
-    "steel - ceramic": "stainless steel and ceramic",
-    "ceramic and titanium": "ceramic and titanium",
     "black ceramic": "ceramic",
     "white ceramic": "ceramic",
     "matte white ceramic": "ceramic",
-    "black matte ceramic with white ceramic bezel": "ceramic",
     "blue ceramic": "ceramic",
     "brown ceramic": "ceramic",
-    "ceramic,stainless steel": "ceramic and stainless steel",
-    "ceramic,titanium": "ceramic and titanium",
-    "ceramic,rose gold": "ceramic and rose gold",
-    "ceramic,white gold": "ceramic and white gold",
     "black microblasted ceramic": "ceramic",
-    "ceramic,yellow gold": "ceramic and gold",
     # Platinum
     "platinum": "platinum",
     "platinumtech": "platinum",
-    "platinum 950": "platinum",
     "950 platinum": "platinum",
     # Carbon
     "carbon": "carbon",
     "carbotech": "carbon",
     "full carbon": "carbon",
-    "carbon & microblasted titanium": "carbon and titanium",
     "black carbon": "carbon",
-    "black carbon & 18-ct rose gold": "black carbon and rose gold",
     "titane - carbotech": "carbon",
-    "brushed titanium & chalcedony": "titanium and chalcedony",
     # Additional Materials
     "bmg-tech™": "bronze",  # Mapped to 'bronze' as a possible assumption
     "sapphire": "sapphire",
     "diamond": "diamond",
     "setting,diamonds": "diamond",
-    "skeleton,gold": "skeleton and gold",
-    "skeleton,rose gold": "skeleton and rose gold",
-    "grey,rose gold": "grey and rose gold",
-    "blue,rose gold,silver": "blue, rose gold, and silver",
     "brushed titanium & falcon's eye gemstone": "titanium and gemstone",
     "gold,gradient": "gold gradient",
-    "steel, rose gold, diamond": "stainless steel, rose gold, and diamond",
 }
 
 
+# Rules for raw strings not covered by the mapping above, applied in order:
+# split on separators, strip karat/purity markers and finish words, resolve
+# color qualifiers, then map each part through the dictionary.
+material_separator_pattern = re.compile(r"\s*(?:&|,|/|\+|\s-\s|\band\b)\s*")
+material_bezel_pattern = re.compile(r"\s+with\s+.*\bbezel$")
+material_karat_pattern = re.compile(
+    r"\b\d{1,2}\s*-?\s*(?:k|kt|ct|carat|karat)\b|\b(?:950|904l|316l)\b"
+)
+material_finish_words = {
+    "polished",
+    "brushed",
+    "microblasted",
+    "sandblasted",
+    "satin",
+    "matte",
+    "full",
+}
+material_color_words = {
+    "black",
+    "blue",
+    "brown",
+    "green",
+    "grey",
+    "gray",
+    "khaki",
+    "white",
+}
+gold_color_mapping = {
+    "": "gold",
+    "yellow": "gold",
+    "sand": "gold",
+    "pink": "rose gold",
+    "red": "rose gold",
+    "rose": "rose gold",
+    "white": "white gold",
+}
+material_setting_words = ("diamond", "sapphire", "setting", "brilliant cut", "crystal")
+
+
+def canonicalize_material_part(part):
+    part = material_karat_pattern.sub(" ", part)
+    words = [word for word in part.split() if word not in material_finish_words]
+    part = " ".join(words)
+    if part in case_material_mapping:
+        return case_material_mapping[part]
+    # Color qualifiers: gold keeps its color, ceramic and colors alone drop it
+    if words and words[-1] == "gold":
+        return gold_color_mapping.get(" ".join(words[:-1]), part)
+    if words and words[-1] == "ceramic":
+        return "ceramic"
+    if part in material_color_words:
+        return ""
+    return part
+
+
+def join_material_parts(parts):
+    if len(parts) <= 2:
+        return " and ".join(parts)
+    return ", ".join(parts[:-1]) + ", and " + parts[-1]
+
+
+def canonicalize_material(value):
+    # Dictionary hits go through the same rules so known and unseen variants of
+    # a combination agree
+    value = case_material_mapping.get(value, value)
+    stripped = material_bezel_pattern.sub("", value.replace("™", "").replace("®", ""))
+    parts = []
+    for raw_part in material_separator_pattern.split(stripped):
+        # A part may itself map to a combination such as "titanium and gold"
+        resolved = canonicalize_material_part(raw_part.strip())
+        for part in material_separator_pattern.split(resolved):
+            if part and part not in parts:
+                parts.append(part)
+    # Stone settings only describe the case when no metal is present
+    metals = [p for p in parts if not any(w in p for w in material_setting_words)]
+    if metals:
+        parts = metals
+    # One fixed order, so "titanium, carbon" and "carbon & titanium" agree
+    parts = sorted(parts, key=str.lower)
+    return join_material_parts(parts) if parts else value
+
+
+# Raw -> standardized lookup persisted to a JSON file, so each raw variant is
+# resolved by the rules once and reused across reruns, sessions and restarts
+material_lookup_path = os.environ.get("MATERIAL_LOOKUP_PATH", "material_lookup.json")
+
+
+def code_fingerprint(code):
+    parts = [code.co_code.hex(), *code.co_names]
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            parts.append(code_fingerprint(const))
+        else:
+            parts.append(repr(const))
+    return "|".join(parts)
+
+
+# Digest of the mapping, the rule tables and the rule functions; a stored
+# lookup built under any other digest is discarded
+material_rules_version = hashlib.sha256(
+    json.dumps(
+        [
+            case_material_mapping,
+            material_separator_pattern.pattern,
+            material_bezel_pattern.pattern,
+            material_karat_pattern.pattern,
+            sorted(material_finish_words),
+            sorted(material_color_words),
+            gold_color_mapping,
+            material_setting_words,
+            [
+                code_fingerprint(func.__code__)
+                for func in (
+                    canonicalize_material_part,
+                    join_material_parts,
+                    canonicalize_material,
+                )
+            ],
+        ],
+        sort_keys=True,
+    ).encode("utf-8")
+).hexdigest()
+
+
+@st.cache_resource
+def get_material_lookup():
+    try:
+        with open(material_lookup_path, encoding="utf-8") as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if stored.get("version") != material_rules_version:
+        return {}
+    return stored.get("lookup", {})
+
+
+def save_material_lookup(lookup):
+    # Other sessions may be adding entries, so write a snapshot through a
+    # uniquely named temporary file in the same directory
+    snapshot = {"version": material_rules_version, "lookup": dict(lookup)}
+    lookup_dir = os.path.dirname(os.path.abspath(material_lookup_path))
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=lookup_dir, suffix=".tmp", delete=False
+        ) as f:
+            json.dump(snapshot, f)
+        os.replace(f.name, material_lookup_path)
+    except OSError:
+        # Read-only deployments keep using the in-memory table
+        pass
+
+
+material_lookup = get_material_lookup()
+material_lookup_size = len(material_lookup)
+
+
 # Function to standardize case materials
 def standardize_case_material(value):
     if pd.isnull(value):
         return np.nan
-    value = value.strip().lower()
-    return case_material_mapping.get(value, value)
+    value = " ".join(value.strip().lower().split())
+    if value not in material_lookup:
+        material_lookup[value] = canonicalize_material(value)
+    return material_lookup[value]
 
 
 # Apply to 'CaseMaterial_YourData'
@@ -166,6 +410,10 @@ df["CaseMaterial_YourData_Std"] = df["CaseMaterial_YourData"].apply(
 # Apply to 'CaseMaterial_TimeZ'
 df["CaseMaterial_TimeZ_Std"] = df["CaseMaterial_TimeZ"].apply(standardize_case_material)
 
+# Write the lookup back only when new raw variants were resolved
+if len(material_lookup) > material_lookup_size:
+    save_material_lookup(material_lookup)
+
 # **B. Filter Out Case Diameters Over 70**
 
 df = df[
@@ -225,6 +473,79 @@ df["CaseMaterial_Match"] = (
     df["CaseMaterial_YourData_Std"] == df["CaseMaterial_TimeZ_Std"]
 )
 
+# -----------------------------------
+# 1d. Build the Ranked Mismatch Index
+# -----------------------------------
+
+# Attribute -> (Brand Data column, TimeZ column, match flag column)
+mismatch_attributes = {
+    "Price": ("Price_YourData", "Price_TimeZ", "Price_Match"),
+    "Case Diameter": (
+        "CaseDiameter_YourData",
+        "CaseDiameter_TimeZ",
+        "CaseDiameter_Match",
+    ),
+    "Case Material": (
+        "CaseMaterial_YourData_Std",
+        "CaseMaterial_TimeZ_Std",
+        "CaseMaterial_Match",
+    ),
+}
+
+
+def mismatch_magnitude(df, attribute):
+    yourdata_col, timez_col, _ = mismatch_attributes[attribute]
+    if attribute == "Case Material":
+        # Jaccard distance between the two sets of material parts: 1.0 when
+        # they share nothing, lower when one only adds or drops a part
+        return pd.Series(
+            [
+                material_distance(yourdata, timez)
+                for yourdata, timez in zip(df[yourdata_col], df[timez_col])
+            ],
+            index=df.index,
+            dtype=float,
+        )
+    return (df[yourdata_col] - df[timez_col]).abs()
+
+
+def material_distance(yourdata, timez):
+    if pd.isnull(yourdata) or pd.isnull(timez):
+        return np.nan
+    yourdata_parts = set(material_separator_pattern.split(yourdata)) - {""}
+    timez_parts = set(material_separator_pattern.split(timez)) - {""}
+    shared = yourdata_parts & timez_parts
+    return 1 - len(shared) / len(yourdata_parts | timez_parts)
+
+
+# Built once per dataset: (brand, attribute) -> row ids of mismatched records,
+# sorted by discrepancy magnitude (largest first, missing values last). The
+# cache is keyed on the shard signatures and material rules rather than on a
+# hash of the frame, which Streamlit only samples for large frames.
+@st.cache_data(max_entries=1)
+def build_mismatch_index(dataset_key, _df):
+    mismatch_index = {}
+    for attribute, (_, _, match_col) in mismatch_attributes.items():
+        mismatched = _df[~_df[match_col]]
+        ranked = pd.DataFrame(
+            {
+                "Brand": mismatched["Brand"],
+                "Magnitude": mismatch_magnitude(mismatched, attribute),
+            }
+        ).sort_values("Magnitude", ascending=False, na_position="last", kind="stable")
+        for brand, group in ranked.groupby("Brand", sort=False):
+            mismatch_index[(brand, attribute)] = group.index.to_numpy()
+    return mismatch_index
+
+
+# Top-k worst mismatches restricted to the rows that survive the active filters
+def top_mismatches(mismatch_index, brand, attribute, active_rows, k):
+    row_ids = mismatch_index.get((brand, attribute), np.array([], dtype=int))
+    return row_ids[np.isin(row_ids, active_rows)][:k]
+
+
+mismatch_index = build_mismatch_index((shard_signatures, material_rules_version), df)
+
 # -----------------------------------
 # 2. Interactive Filters
 # -----------------------------------
@@ -442,7 +763,7 @@ df_filtered = df_filtered[
 ]
 
 # -----------------------------------
-# 4. Data Visualization
+# 4. Data Summary
 # -----------------------------------
 
 st.title("TimeZ QA analysis")
@@ -485,13 +806,6 @@ Here's a quick overview of the features and filters available to help you naviga
 st.header("Filtered Data Summary")
 st.write(f"Number of records after filtering: {df_filtered.shape[0]}")
 
-# **Display Filtered Data**
-with st.expander("Show Filtered Data"):
-    st.dataframe(df_filtered.reset_index(drop=True))
-
-# **H. Match Percentage Visualization**
-st.header("Match Percentage between Brand Data and TimeZ")
-
 # Calculate match percentages
 total_records = len(df_filtered)
 price_match_count = df_filtered["Price_Match"].sum()
@@ -509,6 +823,90 @@ material_match_percentage = (
     (material_match_count / total_records) * 100 if total_records > 0 else 0
 )
 
+# Show the match percentages as plain metrics so they render before any chart
+col_price, col_diameter, col_material = st.columns(3)
+col_price.metric("Price Match", f"{price_match_percentage:.2f}%")
+col_diameter.metric("Case Diameter Match", f"{diameter_match_percentage:.2f}%")
+col_material.metric("Case Material Match", f"{material_match_percentage:.2f}%")
+startup_timings.setdefault(
+    "Script start to summary", time.perf_counter() - script_start
+)
+if process_age_at_script_start is not None:
+    startup_timings.setdefault(
+        "Process start to summary",
+        process_age_at_script_start + time.perf_counter() - script_start,
+    )
+
+# **Display Filtered Data**
+with st.expander("Show Filtered Data"):
+    st.dataframe(df_filtered.reset_index(drop=True))
+
+# **Mismatch Drill-Down by Brand**
+st.header("Worst Mismatches by Brand")
+
+col_brand, col_attribute, col_k = st.columns(3)
+
+with col_brand:
+    drilldown_brand = st.selectbox(
+        "Brand",
+        options=sorted(selected_brands),
+        help="Brand to inspect.",
+    )
+
+with col_attribute:
+    drilldown_attribute = st.selectbox(
+        "Attribute",
+        options=list(mismatch_attributes),
+        help="Attribute whose mismatches are ranked.",
+    )
+
+with col_k:
+    drilldown_k = st.number_input(
+        "Number of records",
+        min_value=1,
+        max_value=500,
+        value=10,
+        step=1,
+        help="Number of worst mismatches to show.",
+    )
+
+top_row_ids = top_mismatches(
+    mismatch_index,
+    drilldown_brand,
+    drilldown_attribute,
+    df_filtered.index,
+    int(drilldown_k),
+)
+
+if len(top_row_ids) == 0:
+    st.write("No mismatches for this brand and attribute under the current filters.")
+else:
+    yourdata_col, timez_col, _ = mismatch_attributes[drilldown_attribute]
+    top_mismatch_df = df_filtered.loc[
+        top_row_ids, ["Brand", "ModelNumber", yourdata_col, timez_col]
+    ]
+    top_mismatch_df["Discrepancy"] = mismatch_magnitude(
+        top_mismatch_df, drilldown_attribute
+    )
+    st.dataframe(top_mismatch_df.reset_index(drop=True), use_container_width=True)
+
+# -----------------------------------
+# 5. Charts
+# -----------------------------------
+
+# Deferred until here so a new session sees the summary without waiting for
+# Plotly Express to import
+plotly_import_start = time.perf_counter()
+import plotly.express as px  # For interactive plots
+
+startup_timings.setdefault(
+    "Plotly Express import", time.perf_counter() - plotly_import_start
+)
+charts_start = time.perf_counter()
+
+# **A. Match Percentage Visualization**
+st.header("Match Percentage between Brand Data and TimeZ")
+
 # Create a dataframe for plotting
 match_percentages = pd.DataFrame(
     {
@@ -533,7 +931,7 @@ fig_match = px.bar(
 fig_match.update_traces(texttemplate="%{text:.2f}%", textposition="auto")
 st.plotly_chart(fig_match, use_container_width=True)
 
-# **F. Match Flags Distribution**
+# **B. Match Flags Distribution**
 st.header("Match Distribution")
 
 col7, col8, col9 = st.columns(3)
@@ -601,7 +999,7 @@ with col9:
     )
     st.plotly_chart(fig11)
 
-# **G. Median Price Comparison by Brand**
+# **C. Median Price Comparison by Brand**
 st.header("Median Price Comparison by Brand")
 
 median_price = (
@@ -643,7 +1041,7 @@ fig13.update_layout(
 fig13.update_yaxes(tickformat="$,.0f")
 st.plotly_chart(fig13, use_container_width=True)
 
-# **A. Histograms for Price Distribution**
+# **D. Histograms for Price Distribution**
 st.header("Price Distribution")
 
 col1, col2 = st.columns(2)
@@ -728,3 +1126,18 @@ fig8.update_layout(
     height=600,
 )
 st.plotly_chart(fig8, use_container_width=True)
+startup_timings.setdefault("Chart construction", time.perf_counter() - charts_start)
+
+# -----------------------------------
+# 6. Startup Timings
+# -----------------------------------
+
+with st.expander("Startup Timings"):
+    st.table(
+        pd.DataFrame(
+            {
+                "Step": list(startup_timings),
+                "Seconds": [round(v, 3) for v in startup_timings.values()],
+            }
+        )
+    )